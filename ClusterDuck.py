@@ -9,6 +9,8 @@ Requirements
 ------------
 * Python ≥ 3.9 on Windows
 * `pip install customtkinter pillow psutil`
+* optional: `pip install orjson` for faster JSON parsing / pretty-printing
+* optional: `pip install ijson` to stream large topologies instead of loading them
 * MySQL Shell (`mysqlsh`) available in %PATH%
 * LED images in an `img/` folder (LED.png, greenLED.png, yellowLED.png, redLED.png, blueLED.png)
 
@@ -18,19 +20,38 @@ Run with:
 
 from __future__ import annotations
 
+import asyncio
+import io
 import json
 import os
 import queue
+import re
 import subprocess
 import sys
+import threading
+import time
+import tkinter
+from collections import deque
 from tkinter import messagebox  # add this at the top
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
+from urllib.parse import quote
 
 import customtkinter as ctk
 from PIL import Image
 
+try:                                # optional C JSON codec, stdlib json otherwise
+    import orjson
+except ImportError:
+    orjson = None
+
+try:                                # optional streaming parser for large status blobs
+    import ijson
+except ImportError:
+    ijson = None
+
 ###############################################################################
 # -- utility helpers --
 ###############################################################################
@@ -73,145 +94,652 @@ def center_window(win, width: int | None = None, height: int | None = None):
     win.geometry(f"{width}x{height}+{x}+{y}")
 
 
+_JD = json.JSONDecoder()   # raw_decode: parse from an offset, no slice copy
+_JSON_START_RE = re.compile(r"\s*\{")   # leading whitespace, then an object
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON with orjson when installed; raises a ValueError subclass."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_pretty(obj: Any) -> str:
+    """Indent *obj* by two spaces, keeping non-ASCII text readable."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:                        # e.g. ints beyond 64 bit
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def json_dumps_str(text: str) -> str:
+    """Encode one string as a JSON literal (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(text).decode()
+    return json.dumps(text, ensure_ascii=False)
+
+
 IMG = resource_path("img")
 
+LED_FILES = ("LED.png", "greenLED.png", "yellowLED.png", "redLED.png", "blueLED.png")
+
+# read once per process: a PyInstaller one-file build unpacks into a temp dir
+# on disk, and every LEDManager (one per tab / reconnect) would re-read it.
+# A missing file must not break the import: it is skipped here and fails
+# lazily in LEDManager._load, as it always did
+def _read_led_bytes() -> Dict[str, bytes]:
+    data: Dict[str, bytes] = {}
+    for fn in LED_FILES:
+        try:
+            data[fn] = (IMG / fn).read_bytes()
+        except OSError:
+            pass
+    return data
+
+
+_LED_BYTES: Dict[str, bytes] = _read_led_bytes()
+
 class LEDManager:
-    """Caches PIL images and handles blink animation via `after`."""
+    """Caches PIL images and drives every blinking LED from one shared `after` tick."""
+
+    INTERVAL = 500   # ms between blink phases
 
     def __init__(self, root: ctk.CTk):
         self.root         = root
         self._cache: Dict[str, ctk.CTkImage] = {}
-        self._blink_jobs: Dict[str, str]     = {}   # widget->after-id
-        self._blink_state: Dict[str, bool]   = {}
-
+        # widget -> (image shown on the "on" phase, image shown on the "off" phase)
+        self._blinkers: Dict[ctk.CTkLabel, tuple[ctk.CTkImage, ctk.CTkImage]] = {}
+        self._phase    = False
+        self._tick_job: str | None = None
+
+        # decode every LED up front so no blink callback ever touches disk
+        for filename in _LED_BYTES:
+            self._cache[filename] = self._decode(filename)
+
+    @staticmethod
+    def _decode(filename: str) -> ctk.CTkImage:
+        data = _LED_BYTES.get(filename)
+        img = Image.open(io.BytesIO(data) if data is not None else IMG / filename)
+        img.load()                               # force pixel decode now
+        return ctk.CTkImage(img)
 
     def _load(self, filename: str) -> ctk.CTkImage:
         if filename not in self._cache:
-            self._cache[filename] = ctk.CTkImage(Image.open(IMG / filename))
+            self._cache[filename] = self._decode(filename)
         return self._cache[filename]
 
+    def _show(self, widget: ctk.CTkLabel, img: ctk.CTkImage):
+        # `widget.image` is the last image applied; skip identical repaints
+        if getattr(widget, "image", None) is img:
+            return
+        try:
+            widget.configure(image=img)
+            widget.image = img                   # keep reference
+        except Exception as e:
+            print(f"[LEDManager] Error updating LED: {e}")
+
     def set(self, widget: ctk.CTkLabel, filename: str, blink: bool = False):
         """Apply image; if *blink* toggle between image and blank LED.png."""
         self.stop(widget)
 
         if blink:
-            on = self._load(filename)
-            off = self._load("LED.png")
-            self._blink_state[widget] = False
-
-            def _step():
-                if not widget.winfo_exists():
-                    return  # Widget destroyed, stop blinking
-
-                self._blink_state[widget] = not self._blink_state[widget]
-                img = on if self._blink_state[widget] else off
-                try:
-                    widget.configure(image=img)
-                    widget.image = img
-                except Exception as e:
-                    print(f"[LEDManager] Error updating LED: {e}")
-                    return
-
-                job_id = self.root.after(500, _step)
-                self._blink_jobs[widget] = job_id
-
-            _step()  # Start blinking
+            self._start_blink(widget, self._load(filename), self._load("LED.png"))
         else:
             # Just set the image statically
-            try:
-                img = self._load(filename)
-                widget.configure(image=img)
-                widget.image = img
-            except Exception as e:
-                print(f"[LEDManager] Error setting static LED: {e}")
+            self._show(widget, self._load(filename))
 
         # ------------------------------------------------------------------
-    def blink_between(self, widget: ctk.CTkLabel,
-                      file_a: str, file_b: str,
-                      interval: int = 500):
+    def blink_between(self, widget: ctk.CTkLabel, file_a: str, file_b: str):
         """
         Blink by toggling between *file_a* and *file_b* instead of
         the old “on / blank” style.
         """
         self.stop(widget)                       # cancel any prior blink
+        self._start_blink(widget, self._load(file_a), self._load(file_b))
 
-        img_a = self._load(file_a)
-        img_b = self._load(file_b)
-        self._blink_state[widget] = False
-
-        def _step():
-            if not widget.winfo_exists():       # widget was destroyed
-                return
-            self._blink_state[widget] = not self._blink_state[widget]
-            img = img_a if self._blink_state[widget] else img_b
-            widget.configure(image=img)
-            widget.image = img                  # keep reference
-            job_id = self.root.after(interval, _step)
-            self._blink_jobs[widget] = job_id
+    def _start_blink(self, widget: ctk.CTkLabel,
+                     img_on: ctk.CTkImage, img_off: ctk.CTkImage):
+        self._blinkers[widget] = (img_on, img_off)
+        self._show(widget, img_on if self._phase else img_off)
+        if self._tick_job is None:
+            self._tick_job = self.root.after(self.INTERVAL, self._tick)
 
-        _step()
+    def _tick(self):
+        """Flip the shared phase and repaint every registered LED."""
+        self._tick_job = None
+        self._phase = not self._phase
 
+        for widget, (img_on, img_off) in list(self._blinkers.items()):
+            if not widget.winfo_exists():       # widget was destroyed
+                del self._blinkers[widget]
+                continue
+            if not widget.winfo_viewable():     # hidden tab / unmapped: catch up later
+                continue
+            self._show(widget, img_on if self._phase else img_off)
 
+        if self._blinkers:
+            self._tick_job = self.root.after(self.INTERVAL, self._tick)
 
     def stop(self, widget: ctk.CTkLabel):
-        job_id = self._blink_jobs.pop(widget, None)
-        if job_id:
-            self.root.after_cancel(job_id)
-        self._blink_state.pop(widget, None)
+        self._blinkers.pop(widget, None)
+        if not self._blinkers and self._tick_job is not None:
+            self.root.after_cancel(self._tick_job)
+            self._tick_job = None
 
 
 ###############################################################################
 # -- MySQL Shell interaction helpers --
 ###############################################################################
 
-def run_mysqlsh(uri: str, js: str) -> str:
+def uri_credentials(creds: Dict[str, str]) -> str:
+    """``user:password`` part of a mysqlsh URI, percent-encoding the password."""
+    return f"{creds['user']}:{quote(creds['pass'], safe='')}"
+
+
+_PASSWORD_WARNING = "can be insecure"     # "Using a password ... can be insecure."
+_PASSWORD_ENV = "CLUSTERDUCK_PASSWORD"    # session env var AdminAPI templates read
+
+
+# computed once: copying the whole process environment per spawn is wasted
+# work, and nothing in the GUI changes os.environ after start-up
+_MYSQLSH_ENV: Dict[str, str] = {
+    **os.environ,
+    "MYSQLSH_WARN_PASSWORD": "0",                # hide CLI-password warning
+}
+
+
+def _mysqlsh_args(uri: str, mode: str, *extra: str) -> List[str]:
+    """Command line for mysqlsh connected to *uri* in JS or SQL *mode*."""
+    return ["mysqlsh", "--uri", uri, f"--{mode}", *extra]
+
+
+def _clean_stderr(stderr: bytes) -> str:
+    """Decode mysqlsh stderr, dropping only the "Using a password ..." warning."""
+    lines = [
+        ln for ln in stderr.decode(errors="replace").strip().splitlines()
+        if _PASSWORD_WARNING not in ln
+    ]
+    return "\n".join(lines).strip()
+
+
+def run_mysqlsh(uri: str, code: str, *, mode: str = "js",
+                binary: bool = False) -> str | bytes:
     """
     Run mysqlsh in --batch mode.  If the shell exits with non-zero status,
     raise RuntimeError so callers can handle it cleanly.
-    """
-    env = os.environ.copy()
-    env["MYSQLSH_WARN_PASSWORD"] = "0"           # hide CLI-password warning
 
+    Output is captured as bytes; with *binary* it is returned undecoded so
+    JSON can be parsed straight from the buffer.
+    """
     result = subprocess.run(
-        ["mysqlsh", "--uri", uri, "--js", "-e", js],
+        _mysqlsh_args(uri, mode, "-e", code),
         capture_output=True,
-        text=True,
-        env=env,
+        env=_MYSQLSH_ENV,
         creationflags=subprocess.CREATE_NO_WINDOW
     )
 
-    # Drop only the "Using a password ..." warning
-    stderr_lines = [
-        ln for ln in result.stderr.strip().splitlines()
-        if "can be insecure" not in ln
-    ]
-    stderr_clean = "\n".join(stderr_lines).strip()
-
     if result.returncode != 0:
         # Any mysqlsh failure bubbles up as an exception
-        raise RuntimeError(stderr_clean or "mysqlsh exited with code "
+        raise RuntimeError(_clean_stderr(result.stderr) or "mysqlsh exited with code "
                          f"{result.returncode}")
 
-    return result.stdout.strip()
+    stdout = result.stdout.strip()
+    return stdout if binary else stdout.decode(errors="replace")
+
+
+async def run_mysqlsh_async(uri: str, code: str, *, mode: str = "js",
+                            binary: bool = False) -> str | bytes:
+    """
+    Coroutine twin of :func:`run_mysqlsh`; must run on the background loop
+    (see :func:`background_loop`).
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *_mysqlsh_args(uri, mode, "-e", code),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=_MYSQLSH_ENV,
+        creationflags=subprocess.CREATE_NO_WINDOW
+    )
+    stdout, stderr = await proc.communicate()
+
+    if proc.returncode != 0:
+        raise RuntimeError(_clean_stderr(stderr) or "mysqlsh exited with code "
+                         f"{proc.returncode}")
+
+    stdout = stdout.strip()
+    return stdout if binary else stdout.decode(errors="replace")
+
+
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_LOCK = threading.Lock()
+
+
+def background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared asyncio loop, starting its daemon thread on first use."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name="mysqlsh-loop",
+                             daemon=True).start()
+    return _LOOP
+
+
+_BATCH_SPLIT = "---SPLIT---"
+# each separator SELECT prints a header line and a value line
+_BATCH_SPLIT_RE = re.compile(rf"(?:^[^\n]*{_BATCH_SPLIT}[^\n]*(?:\n|$)){{2}}", re.MULTILINE)
+
+
+async def run_mysqlsh_batch_async(uri: str, statements: List[str]) -> List[str]:
+    """
+    Run several SQL *statements* in a single mysqlsh invocation and return
+    one output chunk per statement.  Must run on the background loop.
+    """
+    separator = f" SELECT '{_BATCH_SPLIT}' AS `{_BATCH_SPLIT}`; "
+    out = await run_mysqlsh_async(uri, separator.join(statements), mode="sql")
+    return [part.strip() for part in _BATCH_SPLIT_RE.split(out)]
+
 
+class MysqlShSession:
+    """
+    One long-lived `mysqlsh` process fed through stdin/stdout pipes.
+
+    Spawning mysqlsh (interpreter start-up + connection handshake) costs far
+    more than most of the commands we send, so each GUI keeps a single shell
+    open and frames every request with sentinel lines so the response can be
+    read back without waiting for EOF.
+    """
+
+    _BEGIN = "<<BEGIN>>"
+    _END   = "<<END>>"
+    _ERROR = "<<ERROR>>"
+
+    # markers are split in the JS source so an echoed input line can never
+    # be mistaken for the printed marker itself
+    @staticmethod
+    def _js_str(marker: str) -> str:
+        half = len(marker) // 2
+        return f"'{marker[:half]}' + '{marker[half:]}'"
+
+    # prompts are written without a trailing newline, so they end up
+    # glued to the front of whatever the shell prints next
+    _PROMPT_RE = re.compile(r"^(?:\s*(?:mysql-(?:js|sql|py)|MySQL\b[^>]*)\s*>\s*)+")
+
+    # deadline for read-only callers; commands that change cluster state get
+    # none (killing mysqlsh mid-AdminAPI call can leave metadata half-written)
+    # and are only ever stopped by an explicit cancel()
+    TIMEOUT = 300.0
+
+    def __init__(self, uri: str, password: str | None = None):
+        self.uri   = uri
+        # handed to the shell via its environment so AdminAPI calls on other
+        # instances can authenticate without a prompt (see _instance_js)
+        self._env  = _MYSQLSH_ENV
+        if password is not None:
+            self._env = {**_MYSQLSH_ENV, _PASSWORD_ENV: password}
+        self.proc: subprocess.Popen | None = None
+        self._lines: queue.Queue[str | None] = queue.Queue()
+        self._sent: set[str] = set()                 # lines written this exec()
+        self._cancelled = False
+        self._mode = "js"
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    def _ensure_started(self):
+        if self.proc is not None and self.proc.poll() is None:
+            return
 
+        # --no-wizard: never stop to prompt (passwords, confirmations) —
+        # nobody is at this stdin to answer
+        self.proc = subprocess.Popen(
+            _mysqlsh_args(self.uri, "js", "--interactive=full", "--no-wizard",
+                          "--quiet-start=2"),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,                # keep errors in-band
+            bufsize=1,
+            text=True,
+            encoding="utf-8",                        # not the locale codec (cp1252)
+            errors="replace",                        # a bad byte is not EOF
+            env=self._env,
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+        self._mode = "js"
+        # a fresh queue per process, so a dead shell's last lines can't leak
+        # into the next response
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self.proc.stdout, self._lines),
+                         name="mysqlsh-session-reader", daemon=True).start()
+
+    @staticmethod
+    def _pump(stream, lines: queue.Queue[str | None]):
+        """Reader thread: readline() can't time out, a queue.get() can."""
+        try:
+            for line in stream:
+                lines.put(line)
+        except (OSError, ValueError):                # pipe closed under us
+            pass
+        finally:
+            lines.put(None)                          # EOF
+
+    def start(self):
+        """Launch the shell now rather than on the first exec()."""
+        with self._lock:
+            self._ensure_started()
+
+    def _write(self, text: str):
+        # remembered so the shell's echo of them can be dropped from the
+        # response (it would also leak any credentials in the code)
+        self._sent.update(ln.strip() for ln in text.splitlines() if ln.strip())
+        self.proc.stdin.write(text)
+        self.proc.stdin.flush()
+
+    def _switch_mode(self, mode: str):
+        """Flip the running shell between JS and SQL via `\\js` / `\\sql`."""
+        if mode != self._mode:
+            self._write(f"\\{mode}\n")
+            self._mode = mode
 
-def get_cluster_status(uri: str) -> str:
-    """Return raw JSON string from dba.getCluster().status()."""
-    raw = run_mysqlsh(uri, "print(JSON.stringify(dba.getCluster().status()))")
+    # ------------------------------------------------------------------
+    def exec(self, code: str, mode: str = "js", timeout: float | None = None) -> str:
+        """
+        Run *code* (JS by default, or SQL with ``mode="sql"``) and return its
+        output.  Raises RuntimeError if the command fails, the shell dies or
+        is cancelled, or a *timeout* (seconds) was given and no answer arrived
+        in time — the stuck shell is then killed and a fresh one started.
+        Without *timeout* the call waits as long as the command runs.
+        """
+        with self._lock:
+            self._sent.clear()
+            self._cancelled = False
+            try:
+                # inside the try: a failed (re)launch must surface as
+                # RuntimeError like every other session failure
+                self._ensure_started()
+                self._switch_mode("js")
+                self._write(f"println({self._js_str(self._BEGIN)});\n")
+
+                if mode == "sql":
+                    self._switch_mode("sql")
+                    self._write(code.strip() + "\n")
+                    self._switch_mode("js")
+                else:
+                    # print() adds no newline, so end the result line in the
+                    # same statement — otherwise the next prompt is glued on
+                    self._write(
+                        f"try {{ {code.strip()} }} catch (e) "
+                        f"{{ print({self._js_str(self._ERROR)} + e.message); }} "
+                        f"finally {{ println(); }}\n"
+                    )
+
+                self._write(f"print('\\n' + {self._js_str(self._END)} + '\\n');\n")
+                deadline = None if timeout is None else time.monotonic() + timeout
+                output = self._read_response(deadline)
+            except TimeoutError:
+                # e.g. an unclosed quote: the shell is waiting for more input
+                self.close(kill=True)
+                try:
+                    self._ensure_started()
+                except OSError:
+                    pass                             # retried on the next exec()
+                raise RuntimeError(
+                    f"mysqlsh gave no answer within {timeout:g} s; session restarted"
+                ) from None
+            except (OSError, ValueError) as err:
+                self.close()
+                raise RuntimeError(f"mysqlsh session failed: {err}") from err
+
+        if self._ERROR in output:
+            raise RuntimeError(output.split(self._ERROR, 1)[1].strip())
+        if mode == "sql" and re.search(r"^ERROR\b", output, re.MULTILINE):
+            raise RuntimeError(output)
+        return output
+
+    def _read_response(self, deadline: float | None) -> str:
+        noise: List[str] = []                        # start-up / connect errors
+        lines: List[str] = []
+        started = False
+
+        while True:
+            try:
+                line = self._lines.get(
+                    timeout=None if deadline is None else max(deadline - time.monotonic(), 0)
+                )
+            except queue.Empty:
+                raise TimeoutError from None
+            if line is None:                         # EOF → shell exited
+                self.close()
+                if self._cancelled:
+                    raise RuntimeError("cancelled; the operation may still have "
+                                       "partly applied — check the cluster status")
+                detail = "\n".join(noise + lines).strip()
+                raise RuntimeError(detail or "mysqlsh session exited unexpectedly")
+
+            line = self._PROMPT_RE.sub("", line.rstrip("\r\n"))
+            if line.strip() in self._sent:           # --interactive=full echo
+                continue
+
+            if not started:
+                if self._BEGIN in line:
+                    started = True
+                    lines.append(line.split(self._BEGIN, 1)[1])
+                elif _PASSWORD_WARNING not in line:
+                    noise.append(line)
+                continue
+
+            if self._END in line:
+                lines.append(line.split(self._END, 1)[0])
+                break
+            if line.startswith("Switching to ") or _PASSWORD_WARNING in line:
+                continue
+            lines.append(line)
+
+        return "\n".join(lines).strip()
+
+    def cancel(self):
+        """
+        Kill the shell under a running exec() (from any thread): that call
+        raises RuntimeError and the next exec() starts a fresh shell.
+        """
+        proc = self.proc
+        if proc is not None and proc.poll() is None:
+            self._cancelled = True
+            proc.kill()
+
+    def close(self, kill: bool = False):
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        if kill:                                     # stuck: no point asking nicely
+            proc.kill()
+            proc.wait()
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+CLUSTER_STATUS_JS = "print(JSON.stringify(dba.getCluster().status()))"
+
+
+def get_cluster_status(uri: str) -> bytes:
+    """Return raw JSON bytes from dba.getCluster().status()."""
+    raw = run_mysqlsh(uri, CLUSTER_STATUS_JS, binary=True)
     return raw
 
 
-def format_cluster_status(raw: str) -> str:
-    """Try to pretty-print the cluster JSON. Fall back to raw if needed."""
+class _ClusterStatusCache:
+    """
+    Status fetch results keyed by cluster endpoint (the login host, not the
+    per-node URI), so every tab of one cluster shares a single mysqlsh call
+    per TTL window.  Touched from the asyncio loop and pool workers alike.
+    """
+    TTL = 0.5   # seconds a fetched status may be reused
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, tuple[float, Any]] = {}
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry[0]:
+            return None
+        return entry[1]
+
+    def put(self, key: str, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.TTL, value)
+
+    def invalidate(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+_STATUS_CACHE = _ClusterStatusCache()
+
+
+def parse_cluster_status(raw: str | bytes) -> Dict[str, Any]:
+    """
+    Parse mysqlsh status output.  The JSON.stringify() line is normally the
+    whole output, so try that first and only scan for the outer braces when
+    the shell printed warnings around it.
+    """
+    try:
+        return json_loads(raw)
+    except ValueError:
+        open_, close = (b"{", b"}") if isinstance(raw, bytes) else ("{", "}")
+        json_start = raw.find(open_)
+        json_end = raw.rfind(close) + 1
+        return json_loads(raw[json_start:json_end])
+
+
+def topology_nodes(raw: bytes) -> List[str]:
+    """
+    Return the member addresses under ``defaultReplicaSet.topology``.
+
+    With ijson installed only the map keys are read from the event stream,
+    so the per-node metadata is never materialised.  Raises ValueError if
+    the output is not valid status JSON.
+    """
+    if ijson is None:
+        try:
+            return list(parse_cluster_status(raw)["defaultReplicaSet"]["topology"])
+        except (KeyError, TypeError) as err:
+            raise ValueError(f"no topology in cluster status: {err}") from err
+
+    # skip shell noise (warnings) before the JSON, as parse_cluster_status does
+    buf = io.BytesIO(raw)
+    buf.seek(max(raw.find(b"{"), 0))
+
+    nodes: List[str] = []
+    found = False
     try:
-        json_start = raw.find('{')
-        json_end = raw.rfind('}') + 1
-        cleaned_json = raw[json_start:json_end]
-        obj = json.loads(cleaned_json)
-        return json.dumps(obj, indent=2, ensure_ascii=False)
-    except Exception as e:
-        return f"[Raw Cluster Output]\n{raw.strip()}"
+        for prefix, event, value in ijson.parse(buf):
+            if prefix != "defaultReplicaSet.topology":
+                continue
+            if event == "map_key":
+                nodes.append(value)
+            elif event == "start_map":
+                found = True
+            elif event == "end_map":
+                break
+    except ijson.JSONError as err:
+        raise ValueError(str(err)) from err
+
+    if not found:
+        raise ValueError("no topology in cluster status")
+    return nodes
+
+
+def _json_scalar(event: str, value: Any) -> str:
+    if event == "null":
+        return "null"
+    if event == "boolean":
+        return "true" if value else "false"
+    if event == "number":
+        if isinstance(value, int):
+            return str(value)
+        # ijson yields Decimal; render it as the float json_loads would give,
+        # through the codec json_dumps_pretty uses (orjson 1e20, json 1e+20)
+        value = float(value)
+        return orjson.dumps(value).decode() if orjson is not None else json.dumps(value)
+    return json_dumps_str(value)
+
+
+def format_cluster_status_streaming(raw: bytes, start: int = 0) -> str:
+    """
+    Pretty-print status JSON straight from ijson events, so the status
+    document is never materialised as nested dicts (*raw* itself is still
+    held whole).  Parsing begins at byte offset *start* (shell noise before
+    it is skipped without a slice copy).  Output matches
+    :func:`json_dumps_pretty` for the installed codec, float text included
+    (integers beyond 64 bit stay exact here; orjson would read them as
+    floats).  Raises ValueError on malformed input.
+    """
+    if ijson is None:
+        return json_dumps_pretty(parse_cluster_status(raw))
+
+    buf = io.BytesIO(raw)
+    buf.seek(start)
+
+    parts: List[str] = []
+    open_empty: List[bool] = []                  # per open container: no items yet
+    after_key = False
+
+    def _new_item():
+        if open_empty:
+            if not open_empty[-1]:
+                parts.append(",")
+            open_empty[-1] = False
+            parts.append("\n" + "  " * len(open_empty))
+
+    try:
+        for _prefix, event, value in ijson.parse(buf):
+            if event == "map_key":
+                _new_item()
+                parts.append(json_dumps_str(value) + ": ")
+                after_key = True
+            elif event in ("end_map", "end_array"):
+                if not open_empty.pop():
+                    parts.append("\n" + "  " * len(open_empty))
+                parts.append("}" if event == "end_map" else "]")
+            else:
+                if not after_key:
+                    _new_item()
+                after_key = False
+                if event == "start_map":
+                    parts.append("{")
+                    open_empty.append(True)
+                elif event == "start_array":
+                    parts.append("[")
+                    open_empty.append(True)
+                else:
+                    parts.append(_json_scalar(event, value))
+    except ijson.JSONError as err:
+        raise ValueError(str(err)) from err
+
+    return "".join(parts)
+
+
+def format_cluster_status(status: str | bytes | Dict[str, Any]) -> str:
+    """Pretty-print the cluster JSON (raw output or already parsed). Fall back to raw if needed."""
+    if isinstance(status, dict):
+        return json_dumps_pretty(status)
+    try:
+        return json_dumps_pretty(parse_cluster_status(status))
+    except ValueError:
+        if isinstance(status, bytes):
+            status = status.decode(errors="replace")
+        return f"[Raw Cluster Output]\n{status.strip()}"
 
 
 ###############################################################################
@@ -255,21 +783,48 @@ class LoginDialog(ctk.CTkToplevel):
 
         self.bind("<Return>", lambda _: self._ok())
         self.bind("<Escape>", lambda _: self._cancel())
+        self.protocol("WM_DELETE_WINDOW", self._cancel)
 
         self.result: Dict[str, str] | None = None
+        self._answered = tkinter.BooleanVar(self, value=False)
 
     # ---------------------------------------------------------------------
+    def ask(self) -> Dict[str, str] | None:
+        """
+        Show the dialog and block (running the event loop) until OK or
+        Cancel.  The dialog is only hidden afterwards, so a failed login can
+        ask again with the same widgets and the fields still filled in.
+        """
+        self.result = None
+        self._answered.set(False)
+        self.deiconify()
+        self.grab_set()
+        self.focus_force()
+        self.wait_variable(self._answered)
+        return self.result
+
+    def show_error(self, err: Exception):
+        messagebox.showerror(
+            "Connect Error",
+            f"Could not connect or parse topology:\n\n{err}"
+        )
+
     def _ok(self):
         self.result = {
             "user": self.user_var.get().strip(),
             "pass": self.pass_var.get(),
             "host": self.host_var.get().strip() or "localhost",
         }
-        self.destroy()
+        self._close()
 
     def _cancel(self):
         self.result = None
-        self.destroy()
+        self._close()
+
+    def _close(self):
+        self.grab_release()
+        self.withdraw()
+        self._answered.set(True)
 
 
 ###############################################################################
@@ -304,11 +859,12 @@ CLUSTER_COMMANDS: List[Dict[str, str]] = [
         "title": "Rescan Topology",
         "template": "dba.getCluster().rescan()",
         "mode": "JS",
-        "risk": "safe"
+        "risk": "safe",
+        "writes": True      # updates metadata: never killed on a deadline
     },
     {
         "title": "Check Instance Health",
-        "template": "dba.checkInstanceConfiguration('<user>@<node>')",
+        "template": "dba.checkInstanceConfiguration(<instance>)",
         "mode": "JS",
         "risk": "safe"
     },
@@ -322,7 +878,8 @@ CLUSTER_COMMANDS: List[Dict[str, str]] = [
         "title": "Rejoin Instance",
         "template": "dba.getCluster().rejoinInstance('<node>')",
         "mode": "JS",
-        "risk": "safe"
+        "risk": "safe",
+        "writes": True      # recovery may pick clone: can run for hours
     },
 
     # ―― Higher-risk cluster actions ――
@@ -349,14 +906,14 @@ CLUSTER_COMMANDS: List[Dict[str, str]] = [
     },
     {
         "title": "Add Instance (Clone)",
-        "template": "dba.getCluster().addInstance('<user>@<node>',{recoveryMethod:'clone'})",
+        "template": "dba.getCluster().addInstance(<instance>,{recoveryMethod:'clone'})",
         "mode": "JS",
         "risk": "danger",
         "danger": "Target must be empty; will wipe existing data."
     },
     {
         "title": "Remove Instance",
-        "template": "dba.getCluster().removeInstance('<user>@<node>')",
+        "template": "dba.getCluster().removeInstance(<instance>)",
         "mode": "JS",
         "risk": "danger",
         "danger": "Permanent; instance leaves the replication group."
@@ -463,6 +1020,75 @@ CLUSTER_COMMANDS: List[Dict[str, str]] = [
 ]
 
 
+_PLACEHOLDER_RE = re.compile(r"<(user|pass|node|instance)>")
+
+
+def _instance_js(user: str, node: str) -> str:
+    """
+    JS connection dict for *user* at *node*.  The password is read inside
+    the shell from its environment (see MysqlShSession), so it never appears
+    in the command text, the terminal, or any cache / in-flight key.
+    """
+    host, _, port = node.rpartition(":")
+    if not host or not port.isdigit():
+        host, port = node, ""
+    fields = f"user: '{user}', host: '{host}'" + (f", port: {port}" if port else "")
+    return f"{{{fields}, password: os.getenv('{_PASSWORD_ENV}')}}"
+
+
+@lru_cache(maxsize=256)
+def _wrap_js(filled: str) -> str:
+    """Wrap a filled JS template so its result is printed as JSON (memoised)."""
+    if filled.lstrip().startswith("print("):
+        return filled
+    return f"print(JSON.stringify({filled}))"
+
+
+SORT_ORDER = {
+    ("JS", "safe"): 0,
+    ("SQL", "safe"): 1,
+    ("JS", "danger"): 2,
+    ("SQL", "danger"): 3,
+}
+
+
+def _command_button(cmd: Dict[str, str]) -> tuple[Dict[str, str], str, str, str]:
+    mode = cmd.get("mode", "JS")
+    risk = cmd.get("risk", "safe")
+    fg_color, hover_color = COLOR_MAP.get((mode, risk), ("#444", "#333"))
+    button_text = f"⚠️ {cmd['title']}" if risk == "danger" else cmd["title"]
+    return cmd, button_text, fg_color, hover_color
+
+
+# (command, button text, fg colour, hover colour) in display order; identical
+# for every ClusterGUI, so it is computed once at import
+COMMAND_BUTTONS: List[tuple[Dict[str, str], str, str, str]] = [
+    _command_button(cmd)
+    for cmd in sorted(
+        CLUSTER_COMMANDS,
+        key=lambda c: SORT_ORDER.get((c.get("mode", "JS"), c.get("risk", "safe")), 99),
+    )
+]
+
+# (label, command title) pairs fetched for every node card in one batch
+NODE_DIAGNOSTICS: List[tuple[str, str]] = [
+    ("GTID",   "Check GTID Mode"),
+    ("Binlog", "Check Binlog Format"),
+    ("SSL",    "Check SSL Settings"),
+    ("Server", "Server Version"),
+]
+
+_TEMPLATES = {cmd["title"]: cmd["template"] for cmd in CLUSTER_COMMANDS}
+
+
+def _last_value(block: str) -> str:
+    """Last column of the last row of a tab-separated mysqlsh result."""
+    lines = block.strip().splitlines()
+    if len(lines) < 2:                           # header only / empty set
+        return "?"
+    return lines[-1].split("\t")[-1].strip() or "?"
+
+
 
 
 
@@ -472,16 +1098,30 @@ class ClusterGUI(ctk.CTkFrame):
         self.master = master
         self.mysql_uri = mysql_uri
         self.creds = creds
+        self._user_pass = uri_credentials(creds)
 
         self.node_var = ctk.StringVar()
+        self._prev_selected = ""
         self.node_leds: Dict[str, ctk.CTkLabel] = {}
+        self._node_cards: Dict[str, ctk.CTkFrame] = {}
+        self._node_info_labels: Dict[str, ctk.CTkLabel] = {}
+        self._node_diag_labels: Dict[str, ctk.CTkLabel] = {}
+        self._node_status_map: Dict[str, Dict[str, Any]] = {}
 
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("dark-blue")
 
         self.led_mgr = LEDManager(self)
+        self.session = MysqlShSession(mysql_uri, creds["pass"])
         self.executor = ThreadPoolExecutor(max_workers=4)
-        self.output_q: queue.Queue[str] = queue.Queue()
+        self._inflight: Dict[tuple[str, str], Future] = {}   # (title, code) -> running task
+        self.loop = background_loop()
+        self._pending_refresh_id: str | None = None
+        self._pending_refresh_silent = True
+        self.output_q: queue.Queue[str] = queue.Queue(maxsize=self.OUTPUT_QUEUE_MAX)
+        self._out_pending: deque[str] = deque()         # drained, not yet inserted
+        self._drain_idle_job: str | None = None
+        self._log_flush_scheduled = False               # a <<LogReady>> is pending
 
         # ─── grid layout ────────────────────────────────────────────────
         self.grid_rowconfigure(0, weight=0)   # summary bar
@@ -499,11 +1139,17 @@ class ClusterGUI(ctk.CTkFrame):
         self.summary_lbl = ctk.CTkLabel(top_bar, text="Loading…", font=("Segoe UI", 14, "bold"))
         self.summary_lbl.grid(row=0, column=0, sticky="w")
 
-        self.refresh_btn = ctk.CTkButton(top_bar, text="Refresh", command=self.refresh_cluster)
-        self.refresh_btn.grid(row=0, column=1, sticky="e", padx=(0, 10))
+        self.cancel_btn = ctk.CTkButton(top_bar, text="Cancel", width=80,
+                                        fg_color="#6c757d", hover_color="#5a6268",
+                                        command=self._cancel_command)
+        self.cancel_btn.grid(row=0, column=1, sticky="e", padx=(0, 10))
+
+        self.refresh_btn = ctk.CTkButton(top_bar, text="Refresh",
+                                         command=lambda: self.refresh_cluster(force=True))
+        self.refresh_btn.grid(row=0, column=2, sticky="e", padx=(0, 10))
 
         self.status_led_lbl = ctk.CTkLabel(top_bar, text="")
-        self.status_led_lbl.grid(row=0, column=2, sticky="e")
+        self.status_led_lbl.grid(row=0, column=3, sticky="e")
 
         # ─── node list panel ────────────────────────────────────────────
         self.node_frame = ctk.CTkScrollableFrame(self, width=600, height=265)
@@ -519,22 +1165,7 @@ class ClusterGUI(ctk.CTkFrame):
                      font=("Segoe UI", 14, "bold")).pack(pady=(0, 0))
 
         self._cmd_btns: List[ctk.CTkButton] = []
-        SORT_ORDER = {
-            ("JS", "safe"): 0,
-            ("SQL", "safe"): 1,
-            ("JS", "danger"): 2,
-            ("SQL", "danger"): 3,
-        }
-
-        for cmd in sorted(
-            CLUSTER_COMMANDS,
-            key=lambda c: SORT_ORDER.get((c.get("mode", "JS"), c.get("risk", "safe")), 99),
-        ):
-            mode = cmd.get("mode", "JS")
-            risk = cmd.get("risk", "safe")
-            fg_color, hover_color = COLOR_MAP.get((mode, risk), ("#444", "#333"))
-            button_text = f"⚠️ {cmd['title']}" if risk == "danger" else cmd["title"]
-
+        for cmd, button_text, fg_color, hover_color in COMMAND_BUTTONS:
             btn = ctk.CTkButton(
                 self.cmd_grp_scroll,
                 text=button_text,
@@ -578,42 +1209,189 @@ class ClusterGUI(ctk.CTkFrame):
         )
         self.run_custom_btn.grid(row=0, column=2, sticky="e")
 
-        # initial refresh + log polling
+        # log lines are drained when a producer signals <<LogReady>>; bound via
+        # tkinter.Misc because CTkFrame.bind targets its inner canvas instead
+        tkinter.Misc.bind(self, "<<LogReady>>", lambda _e: self._drain_output())
+
+        # warm the shell up in the background while the first status loads,
+        # so the first command doesn't pay mysqlsh start-up + handshake
+        try:
+            self.session.start()
+        except OSError as err:
+            self.log(f"[ERROR] Could not start mysqlsh: {err}")
+
+        # initial refresh
         self.refresh_cluster()
-        self._poll_output()
 
     
 
     # ------------------------------------------------------------------
+    OUTPUT_QUEUE_MAX = 1024     # undrained messages kept; oldest dropped first
+    OUTPUT_MAX_LINES = 5000     # terminal scrollback
+
     def log(self, text: str):
-        self.output_q.put(text)
+        """Queue *text* for the terminal; safe to call from worker threads."""
+        while True:
+            try:
+                self.output_q.put_nowait(text)
+                break
+            except queue.Full:
+                try:
+                    self.output_q.get_nowait()
+                except queue.Empty:
+                    pass
+        # one pending wake-up is enough: the drain takes everything queued
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.event_generate("<<LogReady>>", when="tail")
+
+    def _send_js(self, js: str, timeout: float | None = None) -> str:
+        """Run *js* on this tab's persistent mysqlsh session."""
+        return self.session.exec(js, timeout=timeout)
+
+    def _cancel_command(self):
+        if not self._inflight:
+            self.log("[INFO] No command is running.")
+            return
+        answer = messagebox.askyesno(
+            "Cancel Running Command",
+            "Kill the mysqlsh session running the current command?\n\n"
+            "An AdminAPI operation stopped part-way may leave the cluster "
+            "half-changed; check the status afterwards."
+        )
+        if answer:
+            self.session.cancel()
+
+    def _submit_single(self, title: str, code: str, fn, *args) -> Future:
+        """
+        Single-flight executor.submit: while the same command (title + code)
+        is still queued or running, return that future instead of queueing
+        a duplicate behind it on the session.  Tk thread only; the map is
+        cleared from Tk as well.
+        """
+        key = (title, code)
+        fut = self._inflight.get(key)
+        if fut is not None and not fut.done():
+            self.log(f"[{title}] already running — skipped duplicate")
+            return fut
+
+        fut = self.executor.submit(fn, *args)
+        self._inflight[key] = fut
+
+        def _clear(done: Future):
+            if self._inflight.get(key) is done:
+                del self._inflight[key]
+
+        # done-callbacks run on the pool worker: hop back to Tk so the map
+        # is only ever touched from one thread
+        fut.add_done_callback(lambda done: self.after(0, _clear, done))
+        return fut
 
-    def run_mysqlsh(self, js: str) -> str:
-        return run_mysqlsh(self.mysql_uri, js)
+    def destroy(self):
+        self.session.close()
+        super().destroy()
 
 
-    def _poll_output(self):
+    OUTPUT_CHUNK_CHARS = 4096   # messages longer than this are split …
+    OUTPUT_CHUNK_LINES = 500    # … into pieces of this many lines
+
+    def _drain_output(self):
+        if self._drain_idle_job is not None:    # this pass replaces it
+            self.after_cancel(self._drain_idle_job)
+            self._drain_idle_job = None
+        self._log_flush_scheduled = False       # cleared before draining: no lost wake-ups
         try:
             while True:
                 msg = self.output_q.get_nowait()
-                self.output_box.configure(state="normal")
-                self.output_box.insert("end", msg + "\n")
-                self.output_box.see("end")
-                self.output_box.configure(state="disabled")
+                if len(msg) > self.OUTPUT_CHUNK_CHARS:
+                    lines = msg.split("\n")
+                    step = self.OUTPUT_CHUNK_LINES
+                    self._out_pending.extend(
+                        "\n".join(lines[i:i + step]) for i in range(0, len(lines), step)
+                    )
+                else:
+                    self._out_pending.append(msg)
         except queue.Empty:
             pass
-        self.after(100, self._poll_output)
+
+        if not self._out_pending:
+            return
+
+        # one insert / one redraw for up to OUTPUT_CHUNK_LINES lines
+        batch: List[str] = []
+        budget = self.OUTPUT_CHUNK_LINES
+        while self._out_pending:
+            cost = self._out_pending[0].count("\n") + 1
+            if batch and cost > budget:
+                break
+            batch.append(self._out_pending.popleft())
+            budget -= cost
+
+        self.output_box.configure(state="normal")
+        self.output_box.insert("end", "\n".join(batch) + "\n")
+        lines = int(self.output_box.index("end-1c").split(".")[0])
+        if lines > self.OUTPUT_MAX_LINES:
+            self.output_box.delete("1.0", f"{lines - self.OUTPUT_MAX_LINES + 1}.0")
+        self.output_box.see("end")
+        self.output_box.configure(state="disabled")
+
+        # yield to the event loop between chunks so clicks stay responsive
+        if self._out_pending and self._drain_idle_job is None:
+            self._drain_idle_job = self.after_idle(self._drain_output)
 
     # ------------------------------------------------------------------
-    def refresh_cluster(self, silent: bool = False):
+    def refresh_cluster(self, silent: bool = False, force: bool = False):
         self.led_mgr.set(self.status_led_lbl, "yellowLED.png", blink=True)
         self.summary_lbl.configure(text="Refreshing…")
-        self.executor.submit(self._load_cluster_status, silent)
+        asyncio.run_coroutine_threadsafe(self._async_load_status(silent, force), self.loop)
+
+    def _schedule_refresh(self, silent: bool = True, delay: int = 50):
+        """
+        Debounced refresh_cluster: a burst of requests within *delay* ms
+        collapses into one trailing refresh (non-silent if any asked for it).
+        Tk thread only — workers should go through ``self.after(0, …)``.
+        """
+        if self._pending_refresh_id is not None:
+            self.after_cancel(self._pending_refresh_id)
+            silent = silent and self._pending_refresh_silent
+        self._pending_refresh_silent = silent
 
+        def _fire():
+            self._pending_refresh_id = None
+            self.refresh_cluster(silent=silent)
 
-    def _load_cluster_status(self, silent: bool = False):
+        self._pending_refresh_id = self.after(delay, _fire)
+
+    async def _fetch_cluster_status(self, force: bool = False
+                                    ) -> tuple[bytes, Dict[str, Any] | None, ValueError | None]:
+        """
+        Return ``(raw, parsed, parse_error)`` for the cluster status, reusing
+        a result any tab fetched < _ClusterStatusCache.TTL ago.  Parsing
+        happens once per fetch, so cache hits cost no JSON work at all.
+        """
+        key = self.creds["host"]
+        cached = None if force else _STATUS_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        raw = await run_mysqlsh_async(self.mysql_uri, CLUSTER_STATUS_JS, binary=True)
         try:
-            raw = get_cluster_status(self.mysql_uri)
+            obj, parse_error = parse_cluster_status(raw), None
+        except ValueError as e:
+            obj, parse_error = None, e
+
+        _STATUS_CACHE.put(key, (raw, obj, parse_error))
+        return raw, obj, parse_error
+
+
+    async def _async_load_status(self, silent: bool = False, force: bool = False):
+        # runs as its own process so a status poll never queues behind a
+        # long-running command (rescan, rejoin, …) on the shared session
+        if not silent:
+            self.log("Getting cluster status using URI:")
+
+        try:
+            raw, obj, parse_error = await self._fetch_cluster_status(force)
         except RuntimeError as err:
             # Could not talk to mysqlsh  →  log + visual clue
             self.log(f"[ERROR] {err}")
@@ -622,32 +1400,19 @@ class ClusterGUI(ctk.CTkFrame):
             self.after(0, lambda: self.led_mgr.set(
                 self.status_led_lbl, "redLED.png", blink=False))
             return
-        
-        if not silent:
-            self.log("Getting cluster status using URI:")
-
-        raw = get_cluster_status(self.mysql_uri)
 
         if not silent:
-            formatted = format_cluster_status(raw)
-            self.log(formatted)
-
-        try:
-            json_start = raw.find('{')
-            json_end = raw.rfind('}') + 1
-            cleaned_json = raw[json_start:json_end]
-            obj = json.loads(cleaned_json)
-        except Exception as e:
-            if not silent:
-                self.log(f"[ERROR] JSON parse failed: {e}")
-            obj = None
+            self.log(format_cluster_status(obj if obj is not None else raw))
+            if parse_error is not None:
+                self.log(f"[ERROR] JSON parse failed: {parse_error}")
 
-        self.after(0, self._apply_cluster_status, obj)
+        # only the explicit Refresh button (force) re-probes known nodes
+        self.after(0, self._apply_cluster_status, obj, force)
 
 
 
 
-    def _apply_cluster_status(self, obj: Dict[str, Any] | None):
+    def _apply_cluster_status(self, obj: Dict[str, Any] | None, probe_all: bool = False):
         ok = bool(obj)
         led_img = "greenLED.png" if ok else "redLED.png"
         self.led_mgr.set(self.status_led_lbl, led_img, blink=False)
@@ -664,85 +1429,154 @@ class ClusterGUI(ctk.CTkFrame):
             text=f"Cluster: {cluster_name}  |  Mode: {topology_mode}  |  Status: {status_text}"
         )
 
-        # Clear old node frames
-        for child in self.node_frame.winfo_children():
-            child.destroy()
-
-        # Add new nodes
+        # Diff against the cards we already have: only topology changes
+        # create or destroy widgets, everything else is updated in place
         topology = rep.get("topology", {})
-        self.node_leds.clear()
-        self._node_status_map = {}  # holds status info for later LED update
+        for addr in set(self._node_cards) - set(topology):
+            self._remove_node_card(addr)
 
+        new_addrs: List[str] = []
         for addr, node in topology.items():
-            is_primary = node.get("memberRole", "").upper() == "PRIMARY"
-            node_card = ctk.CTkFrame(
-                master=self.node_frame,
-                fg_color="#1a1a1a" if not is_primary else "#1c3d5a",  # default vs. highlight
-                border_color="#3399ff" if is_primary else None,
-                border_width=2 if is_primary else 0
-            )
+            if addr not in self._node_cards:
+                self._create_node_card(addr)
+                new_addrs.append(addr)
+            self._update_node_card(addr, node)
+
+        # GTID mode / binlog format / SSL / version practically never change:
+        # probe new cards, and everything only when the user asks for it
+        to_probe = list(topology) if probe_all else new_addrs
+        if to_probe:
+            asyncio.run_coroutine_threadsafe(self._probe_all_nodes(to_probe), self.loop)
+
+    def _create_node_card(self, addr: str):
+        node_card = ctk.CTkFrame(master=self.node_frame, fg_color="#1a1a1a", border_width=0)
+        node_card.pack(fill="x", padx=10, pady=5)
+
+        top_row = ctk.CTkFrame(master=node_card, fg_color="transparent")
+        top_row.pack(fill="x", padx=10)
+
+        # --- LED icon for node status ---
+        led_lbl = ctk.CTkLabel(master=top_row, text="")
+        led_lbl.pack(side="left", padx=5, pady=5)
+
+        # --- Radio button to select node ---
+        rb = ctk.CTkRadioButton(
+            master=top_row,
+            text=addr,
+            variable=self.node_var,
+            value=addr,
+        )
+        rb.pack(side="left", padx=5, pady=5)
+
+        # --- Node details below the selection row ---
+        info_label = ctk.CTkLabel(master=node_card, text="", anchor="w", justify="left")
+        info_label.pack(fill="x", padx=10, pady=(5, 0))
+
+        diag_label = ctk.CTkLabel(master=node_card, text="Diagnostics: loading…",
+                                  anchor="w", justify="left", text_color="gray70")
+        diag_label.pack(fill="x", padx=10, pady=(0, 5))
 
-            node_card.pack(fill="x", padx=10, pady=5)
+        self._node_cards[addr] = node_card
+        self.node_leds[addr] = led_lbl
+        self._node_info_labels[addr] = info_label
+        self._node_diag_labels[addr] = diag_label
 
-            top_row = ctk.CTkFrame(master=node_card, fg_color="transparent")
-            top_row.pack(fill="x", padx=10)
+    def _update_node_card(self, addr: str, node: Dict[str, Any]):
+        prev = self._node_status_map.get(addr)
+        self._node_status_map[addr] = node      # holds status info for later LED update
 
-            # --- LED icon for node status ---
-            led_lbl = ctk.CTkLabel(master=top_row, text="")
-            self.node_leds[addr] = led_lbl
-            self._node_status_map[addr] = node
-            led_lbl.pack(side="left", padx=5, pady=5)
-            color = get_led_color(node.get("status", ""), node.get("memberRole", ""))
+        is_primary = node.get("memberRole", "").upper() == "PRIMARY"
+        was_primary = prev is not None and prev.get("memberRole", "").upper() == "PRIMARY"
+        if is_primary != was_primary:           # new cards start un-highlighted
             if is_primary:
-                self.led_mgr.set(led_lbl, "blueLED.png", blink=True)
+                self._node_cards[addr].configure(fg_color="#1c3d5a",
+                                                 border_color="#3399ff", border_width=2)
             else:
-                self.led_mgr.set(led_lbl, f"{color}LED.png")
+                self._node_cards[addr].configure(fg_color="#1a1a1a", border_width=0)
 
+        self._apply_node_led(addr)
 
-            # --- Radio button to select node ---
-            rb = ctk.CTkRadioButton(
-                master=top_row,
-                text=addr,
-                variable=self.node_var,
-                value=addr,
-            )
-            rb.pack(side="left", padx=5, pady=5)
-
-            # --- Node details below the selection row ---
-            info_text = (
-                f"Role: {node.get('memberRole', '?')}  "
-                f"Mode: {node.get('mode', '?')}  "
-                f"Status: {node.get('status', '?')}\n"
-                f"Lag: {node.get('replicationLag', '?')}  "
-                f"Ver: {node.get('version', '?')}"
+        info_text = (
+            f"Role: {node.get('memberRole', '?')}  "
+            f"Mode: {node.get('mode', '?')}  "
+            f"Status: {node.get('status', '?')}\n"
+            f"Lag: {node.get('replicationLag', '?')}  "
+            f"Ver: {node.get('version', '?')}"
+        )
+
+        if node.get("shellConnectError"):
+            info_text += f"\nErr: {node['shellConnectError']}"
+        if node.get("instanceErrors"):
+            for warn in node["instanceErrors"]:
+                info_text += f"\nWarn: {warn}"
+
+        info_label = self._node_info_labels[addr]
+        if info_label.cget("text") != info_text:
+            info_label.configure(text=info_text)
+
+    def _remove_node_card(self, addr: str):
+        led_lbl = self.node_leds.pop(addr)
+        self.led_mgr.stop(led_lbl)
+        self._node_cards.pop(addr).destroy()
+        self._node_info_labels.pop(addr)
+        self._node_diag_labels.pop(addr)
+        self._node_status_map.pop(addr, None)
+
+    def _node_uri(self, addr: str) -> str:
+        return f"{self._user_pass}@{addr}"
+
+    async def _probe_one(self, addr: str) -> str:
+        """Fetch every NODE_DIAGNOSTICS query for *addr* in one mysqlsh call."""
+        statements = [_TEMPLATES[title] for _, title in NODE_DIAGNOSTICS]
+        try:
+            chunks = await run_mysqlsh_batch_async(self._node_uri(addr), statements)
+        except RuntimeError:
+            text = "Diagnostics: unavailable"
+        else:
+            text = "  ".join(
+                f"{label}: {_last_value(chunk)}"
+                for (label, _), chunk in zip(NODE_DIAGNOSTICS, chunks)
             )
+        self.after(0, self._apply_node_diagnostics, addr, text)
+        return text
 
-            if node.get("shellConnectError"):
-                info_text += f"\nErr: {node['shellConnectError']}"
-            if node.get("instanceErrors"):
-                for warn in node["instanceErrors"]:
-                    info_text += f"\nWarn: {warn}"
+    async def _probe_all_nodes(self, addrs: List[str]) -> List[str]:
+        # every node is probed concurrently: wall time ≈ slowest node
+        return await asyncio.gather(*[self._probe_one(a) for a in addrs])
 
-            info_label = ctk.CTkLabel(master=node_card, text=info_text, anchor="w", justify="left")
-            info_label.pack(fill="x", padx=10, pady=5)
+    def _apply_node_diagnostics(self, addr: str, text: str):
+        label = self._node_diag_labels.get(addr)
+        if label is not None and label.winfo_exists():
+            label.configure(text=text)
 
             
 
         # ------------------------------------------------------------------
     def _update_selected_node_led(self):
+        # only the node that lost the selection and the one that gained it
+        # change; every other LED keeps its state (and blink phase)
         selected = self.node_var.get()
-        for node, led_widget in self.node_leds.items():
-            status  = self._node_status_map[node]["status"]
-            role    = self._node_status_map[node]["memberRole"]
-            color   = get_led_color(status, role)
-            base_fn = f"{color}LED.png"
-
-            if node == selected:
-                # Blink between the node’s own colour and blue
-                self.led_mgr.blink_between(led_widget, base_fn, "blueLED.png")
-            else:
-                # Solid light in the node’s own colour
-                self.led_mgr.set(led_widget, base_fn, blink=False)
+        prev, self._prev_selected = self._prev_selected, selected
+        if prev == selected:
+            return
+        for addr in (prev, selected):
+            if addr in self.node_leds:
+                self._apply_node_led(addr)
+
+    def _apply_node_led(self, addr: str):
+        node    = self._node_status_map[addr]
+        led_lbl = self.node_leds[addr]
+        color   = get_led_color(node.get("status", ""), node.get("memberRole", ""))
+        base_fn = f"{color}LED.png"
+
+        if addr == self.node_var.get():
+            # Blink between the node’s own colour and blue
+            self.led_mgr.blink_between(led_lbl, base_fn, "blueLED.png")
+        elif node.get("memberRole", "").upper() == "PRIMARY":
+            self.led_mgr.set(led_lbl, "blueLED.png", blink=True)
+        else:
+            # Solid light in the node’s own colour
+            self.led_mgr.set(led_lbl, base_fn)
 
 
     # ------------------------------------------------------------------
@@ -768,48 +1602,33 @@ class ClusterGUI(ctk.CTkFrame):
         if mode == "JS":
             # Wrap with print if not already wrapped
             wrapped_code = code if code.startswith("print(") else f"print(JSON.stringify({code}))"
-            self.executor.submit(self._exec_command, "Custom JS", wrapped_code)
+            self._submit_single("Custom JS", wrapped_code, self._exec_command, "Custom JS", wrapped_code)
         else:
-            self.executor.submit(self._exec_sql, code)
+            self._submit_single("Custom SQL", code, self._exec_sql, code)
 
         self.custom_input.delete(0, "end")
 
 
 
 
-    def _exec_sql(self, sql_code: str):
-        env = os.environ.copy()
-        env["MYSQLSH_WARN_PASSWORD"] = "0"
-    
-        result = subprocess.run(
-            ["mysqlsh", "--uri", self.mysql_uri, "--sql", "-e", sql_code],
-            capture_output=True,
-            text=True,
-            env=env,
-            creationflags=subprocess.CREATE_NO_WINDOW
-        )
-    
-        # Filter insecure password warning from stderr
-        stderr_lines = [
-            line for line in result.stderr.strip().splitlines()
-            if "Using a password on the command line interface can be insecure" not in line
-        ]
-        stderr_clean = "\n".join(stderr_lines)
-    
-        if result.stdout.strip():
-            pretty = self._beautify_if_json(result.stdout.strip())
-            self.log(pretty)
+    def _exec_sql(self, sql_code: str, timeout: float | None = None):
+        try:
+            out = self.session.exec(sql_code, mode="sql", timeout=timeout)
+        except RuntimeError as err:
+            pretty = f"[SQL ERROR] {err}"
+        else:
+            pretty = self._beautify_if_json(out) if out else ""
+        _STATUS_CACHE.invalidate(self.creds["host"])   # may have changed state
+
+        # refresh like JS commands do: resets the LED and picks up state
+        # changes (read-only mode, group replication start/stop, …)
+        self.after(0, self._apply_command_result, pretty, True)
 
-        if stderr_clean:
-            self.log(f"[SQL ERROR] {stderr_clean}")
-    
-        self.custom_input.delete(0, "end")
-    
 
 
 
     def _run_command(self, cmd: Dict[str, str]):
-        needs_node = "<node>" in cmd["template"]
+        needs_node = "<node>" in cmd["template"] or "<instance>" in cmd["template"]
         node = self.node_var.get()
         if needs_node and not node:
             self.log("[ERROR] Select a node first!")
@@ -827,70 +1646,88 @@ class ClusterGUI(ctk.CTkFrame):
         tpl = cmd["template"]
         mode = cmd.get("mode", "JS")  # Default to JS if not specified
 
-        # Fill in any placeholders
-        filled = (
-            tpl.replace("<node>", node)
-               .replace("<user>", self.creds["user"])
-               .replace("<pass>", self.creds["pass"].replace("'", "\\'"))
-               .replace("<user>@<node>", f"{self.creds['user']}@{node}")
-        )
-
-        # Define post-action refresh trigger
-        def _refresh_after():
-            if cmd["title"] == "Set Primary Instance":
-                self.after(1000, lambda: self.refresh_cluster(silent=True))
+        # Fill in any placeholders in a single pass
+        subs = {
+            "user": self.creds["user"],
+            "pass": self.creds["pass"].replace("'", "\\'"),
+            "node": node,
+            "instance": _instance_js(self.creds["user"].replace("'", "\\'"), node),
+        }
+        filled = _PLACEHOLDER_RE.sub(lambda m: subs[m.group(1)], tpl)
+        # only read-only commands get a deadline; anything that changes the
+        # cluster runs to completion unless the user presses Cancel
+        read_only = cmd.get("risk") == "safe" and not cmd.get("writes")
+        timeout = self.session.TIMEOUT if read_only else None
 
         # Dispatch by mode
         if mode == "SQL":
             self.log(f"[{cmd['title']}]\n{filled}")
             self.led_mgr.set(self.status_led_lbl, "yellowLED.png", blink=True)
-            self.executor.submit(self._exec_sql, filled)
-            self.after(0, _refresh_after)
+            self._submit_single(cmd["title"], filled, self._exec_sql, filled, timeout)
         else:
             # JS mode
-            if not filled.strip().startswith("print("):
-                js_to_run = f"print(JSON.stringify({filled}))"
-            else:
-                js_to_run = filled
+            js_to_run = _wrap_js(filled)
 
             self.log(f"[{cmd['title']}]\n{filled}")
             self.led_mgr.set(self.status_led_lbl, "yellowLED.png", blink=True)
-            self.executor.submit(self._exec_command, cmd["title"], js_to_run)
-            self.after(0, _refresh_after)
+            self._submit_single(cmd["title"], js_to_run, self._exec_command,
+                                cmd["title"], js_to_run, timeout)
 
 
 
-    def _exec_command(self, title: str, js_to_run: str):
-        out = run_mysqlsh(self.mysql_uri, js_to_run)
+    def _exec_command(self, title: str, js_to_run: str, timeout: float | None = None):
+        # worker thread: run + format here, touch Tk only via one after()
+        # a primary switch is worth showing in the terminal
+        silent = title != "Set Primary Instance"
+        try:
+            out = self._send_js(js_to_run, timeout)
+        except RuntimeError as err:
+            # still refresh: resets the LED, and a failed command may have
+            # changed state part-way
+            pretty = f"[ERROR] {err}"
+        else:
+            pretty = self._format_command_output(title, out)
+        _STATUS_CACHE.invalidate(self.creds["host"])   # may have changed state
+
+        self.after(0, self._apply_command_result, pretty, True, silent)
+
+    def _format_command_output(self, title: str, out: str) -> str:
         if title == "Check Cluster Status":
             try:
-                out = format_cluster_status(json.loads(out[out.find("{"):]))
-                pretty = self._beautify_if_json(out)
-                self.log(pretty)
-
-                if title == "Set Primary Instance":
-                    self.after(0, lambda: self.refresh_cluster(silent=False))  # show results in terminal
-                else:
-                    self.after(0, lambda: self.refresh_cluster(silent=True))   # silent for others
-                
-            except Exception:
-                pretty = self._beautify_if_json(out)
-                self.log(pretty)
+                # stream-format: the status blob is never built as dicts
+                raw = out.encode()
+                return format_cluster_status_streaming(raw, max(raw.find(b"{"), 0))
+            except ValueError:
+                pass
+        return self._beautify_if_json(out)
 
-        else:
-            pretty = self._beautify_if_json(out)
+    def _apply_command_result(self, pretty: str, refresh: bool, silent: bool = True):
+        # Tk thread: log the formatted output, then refresh once the command
+        # has really finished (no blind timer)
+        if pretty:
             self.log(pretty)
+        if refresh:
+            self._schedule_refresh(silent)
 
 
     def _beautify_if_json(self, text: str) -> str:
+        # most output (SQL tables, status lines) is not JSON: bail out
+        # before scanning or copying anything
+        m = _JSON_START_RE.match(text)           # anchored: stops at first non-space
+        if m is None:
+            return text
         try:
-            json_start = text.find('{')
-            json_end = text.rfind('}') + 1
-            json_str = text[json_start:json_end]
-            parsed = json.loads(json_str)
-            return json.dumps(parsed, indent=2)
-        except Exception:
-            return text  # Not JSON or can't parse, return original
+            parsed = json_loads(text)                 # orjson when installed
+        except ValueError:
+            try:
+                # trailing shell noise: decode the leading object in place
+                parsed, _ = _JD.raw_decode(text, m.end() - 1)
+            except ValueError:
+                return text  # Not JSON or can't parse, return original
+        return self._beautify_parsed(parsed)
+
+    def _beautify_parsed(self, parsed: Any) -> str:
+        return json_dumps_pretty(parsed)
 
 
 
@@ -899,25 +1736,11 @@ class ClusterGUI(ctk.CTkFrame):
 ###############################################################################
 
 def main():
-    root = ctk.CTk()   # hidden root for login dialog
-    root.withdraw()
-
-    login = LoginDialog(root)
-    root.wait_window(login)
-    if not login.result:
-        return  # user cancelled
-
-    creds = login.result
-    uri = f"{creds['user']}:{creds['pass'].replace('@', '%40')}@{creds['host']}"
-
-    root.destroy()  # close hidden root
-
-    # New main window for tabbed GUI
+    # one CTk root for the whole run: hidden while logging in, then reused
+    # as the main window (saves a second Tk/theme/font initialisation)
     app = ctk.CTk()
-    app.geometry("1020x915")
-    center_window(app, 1020, 915)
-    app.title("ClusterDuck")
-    
+    app.withdraw()
+
     # Try to load icon if available
     icon_path = IMG / "icon.ico"
     if icon_path.exists():
@@ -926,34 +1749,59 @@ def main():
         except Exception:
             pass
 
+    # one dialog for every attempt: a retry re-shows it, no widget rebuild
+    login = LoginDialog(app)
+    creds = login.ask()
+    if not creds:
+        login.destroy()
+        return  # user cancelled
+
+    uri = f"{uri_credentials(creds)}@{creds['host']}"
+
     # ─── attempt login / topology fetch ───────────────────────────────
     while True:
         try:
             cluster_json = get_cluster_status(uri)
-            nodes = list(json.loads(cluster_json)
-                         ['defaultReplicaSet']['topology'].keys())
+            nodes = topology_nodes(cluster_json)
             break                                   # ← success, exit loop
-        except (RuntimeError, json.JSONDecodeError) as err:
-            messagebox.showerror(
-                "Connect Error",
-                f"Could not connect or parse topology:\n\n{err}"
-            )
+        except (RuntimeError, ValueError) as err:
+            login.show_error(err)
             # show login dialog again
-            login = LoginDialog(root)
-            root.wait_window(login)
-            if not login.result:        # user cancelled
+            creds = login.ask()
+            if not creds:               # user cancelled
+                login.destroy()
                 return
-            creds = login.result
-            uri = f"{creds['user']}:{creds['pass'].replace('@', '%40')}@{creds['host']}"
+            uri = f"{uri_credentials(creds)}@{creds['host']}"
+
+    login.destroy()
 
-    tab_view = ctk.CTkTabview(app, width=1000, height=880)
+    # Main window for tabbed GUI
+    app.deiconify()
+    app.geometry("1020x915")
+    center_window(app, 1020, 915)
+    app.title("ClusterDuck")
+
+    # tabs start as empty placeholders; a node's ClusterGUI (widgets, shell
+    # session, executor) is only built the first time its tab is opened
+    pending: Dict[str, str] = {}                 # tab name -> node URI
+
+    def _build_current_tab():
+        node = tab_view.get()
+        node_uri = pending.pop(node, None)
+        if node_uri is None:                    # already built
+            return
+        gui = ClusterGUI(tab_view.tab(node), node_uri, creds, node_scope=node)
+        gui.pack(fill="both", expand=True)
+
+    tab_view = ctk.CTkTabview(app, width=1000, height=880, command=_build_current_tab)
     tab_view.pack(padx=10, pady=10, fill="both", expand=True)
 
+    user_pass = uri_credentials(creds)          # encoded once, not per node
     for node in nodes:
-        tab = tab_view.add(node)
-        node_uri = f"{creds['user']}:{creds['pass'].replace('@', '%40')}@{node}"
-        gui = ClusterGUI(tab, node_uri, creds, node_scope=node)
-        gui.pack(fill="both", expand=True)
+        tab_view.add(node)
+        pending[node] = f"{user_pass}@{node}"
+
+    _build_current_tab()                        # the tab shown at start-up
 
     app.mainloop()
 